@@ -14,32 +14,41 @@ You'll edit this file in Task 2.
 """
 import csv
 import json
+import operator
 
 from models import NearEarthObject, CloseApproach
 
 
+def _select_json_loads():
+    """Return the fastest available JSON `loads`: orjson, then ujson, then the stdlib."""
+    try:
+        from orjson import loads
+    except ImportError:
+        try:
+            from ujson import loads
+        except ImportError:
+            loads = json.loads
+    return loads
+
+
+json_loads = _select_json_loads()
+
+
 def load_neos(neo_csv_path):
     """Read near-Earth object information from a CSV file.
 
     :param neo_csv_path: A path to a CSV file containing data about near-Earth objects.
     :return: A collection of `NearEarthObject`s.
     """
-    neos = []
     with open(neo_csv_path, 'r') as infile:
-        neos_info = csv.DictReader(infile)
-        for neo in neos_info:
-            # neo["pdes"] = neo["pdes"]
-            neo["pha"] = True if neo["pha"] == 'Y' else False
-            neo["name"] = neo["name"] or None
-            neo["diameter"] = float(
-                neo["diameter"]) if neo["diameter"] else float('nan')
-
-            obj = NearEarthObject(pdes=neo["pdes"],
-                                  pha=neo["pha"],
-                                  name=neo["name"],
-                                  diameter=neo["diameter"])
-
-            neos.append(obj)
+        reader = csv.reader(infile)
+        header = next(reader)
+        columns = operator.itemgetter(header.index('pdes'), header.index('pha'),
+                                      header.index('name'), header.index('diameter'))
+        nan = float('nan')
+        neos = [NearEarthObject(pdes, pha == 'Y', name or None,
+                                float(diameter) if diameter else nan)
+                for pdes, pha, name, diameter in map(columns, reader)]
 
     return neos
 
@@ -50,22 +59,12 @@ def load_approaches(cad_json_path):
     :param cad_json_path: A path to a JSON file containing data about close approaches.
     :return: A collection of `CloseApproach`es.
     """
-    cads = []
-    with open(cad_json_path, "r") as infile:
-        cad_info = json.load(infile)
-        cad_info = [dict(zip(cad_info["fields"], data))
-                    for data in cad_info["data"]]
-        for cad in cad_info:
-            # cad["des"] = cad["des"]
-            # cad["cd"] = cad["cd"]
-            # cad["dist"] = float(cad["dist"])
-            # cad["v_rel"] = float(cad["v_rel"])
-
-            obj = CloseApproach(des=cad["des"],
-                                cd=cad["cd"],
-                                dist=float(cad["dist"]),
-                                v_rel=float(cad["v_rel"]))
-
-            cads.append(obj)
+    with open(cad_json_path, "rb") as infile:
+        cad_info = json_loads(infile.read())
+        fields = cad_info["fields"]
+        columns = operator.itemgetter(fields.index("des"), fields.index("cd"),
+                                      fields.index("dist"), fields.index("v_rel"))
+        cads = [CloseApproach(des, cd, float(dist), float(v_rel))  # CAD values are strings.
+                for des, cd, dist, v_rel in map(columns, cad_info["data"])]
 
     return cads
@@ -17,8 +17,13 @@ quirks of the data set, such as missing names and unknown diameters.
 
 You'll edit this file in Task 1.
 """
+import sys
+
 from helpers import cd_to_datetime, datetime_to_str
 
+_NEO_REPR = "NearEarthObject(designation=%r, name=%r, diameter=%.3f, hazardous=%r)"
+_APPROACH_REPR = "CloseApproach(time=%r, distance=%.2f, velocity=%.2f, neo=%r)"
+
 
 class NearEarthObject:
     """A near-Earth object (NEO).
@@ -32,6 +37,8 @@ class NearEarthObject:
     initialized to an empty collection, but eventually populated in the
     `NEODatabase` constructor.
     """
+    __slots__ = ('designation', 'name', 'diameter', 'hazardous', 'approaches')
+
     def __init__(self, pdes: str, pha: bool, name=None, diameter=float('nan')):
         """Create a new `NearEarthObject`.
 
@@ -44,7 +51,7 @@ class NearEarthObject:
 
         """
 
-        self.designation = pdes
+        self.designation = sys.intern(pdes)
         self.name = name
         self.diameter = diameter
         self.hazardous = pha
@@ -65,8 +72,7 @@ class NearEarthObject:
 
     def __repr__(self):
         """Return `repr(self)`, a computer-readable string representation of this object."""
-        return f"NearEarthObject(designation={self.designation!r}, name={self.name!r}, " \
-               f"diameter={self.diameter:.3f}, hazardous={self.hazardous!r})"
+        return _NEO_REPR % (self.designation, self.name, self.diameter, self.hazardous)
 
 
 class CloseApproach:
@@ -82,6 +88,8 @@ class CloseApproach:
     private attribute, but the referenced NEO is eventually replaced in the
     `NEODatabase` constructor.
     """
+    __slots__ = ('_designation', '_cd', '_time', 'distance', 'velocity', 'neo', '_time_str')
+
     def __init__(self, des: str, cd: str, dist: float, v_rel: float):
         """Create a new `CloseApproach`.
 
@@ -93,14 +101,25 @@ class CloseApproach:
 
         """
 
-        self._designation = des
-        self.time = cd_to_datetime(cd)
+        self._designation = sys.intern(des)
+        self._cd = cd
+        self._time = None
         self.distance = dist
         self.velocity = v_rel
 
         # Create an attribute for the referenced NEO, originally None.
         self.neo = None
 
+        # The formatted time is computed on first use by `time_str`.
+        self._time_str = None
+
+    @property
+    def time(self):
+        """Return the approach time as a `datetime`, parsing `cd` on first access."""
+        if self._time is None:
+            self._time = cd_to_datetime(self._cd)
+        return self._time
+
     @property
     def time_str(self):
         """Return a formatted representation of this `CloseApproach`'s approach time.
@@ -113,8 +132,13 @@ class CloseApproach:
         The `datetime_to_str` method converts a `datetime` object to a
         formatted string that can be used in human-readable representations and
         in serialization to CSV and JSON files.
+
+        The string is computed once and cached, since serialization and the
+        string representations all ask for it.
         """
-        return f"{datetime_to_str(self.time)}"
+        if self._time_str is None:
+            self._time_str = datetime_to_str(self.time)
+        return self._time_str
 
     def __str__(self):
         """Return `str(self)`."""
@@ -122,17 +146,18 @@ class CloseApproach:
 
     def __repr__(self):
         """Return `repr(self)`, a computer-readable string representation of this object."""
-        return f"CloseApproach(time={self.time_str!r}, distance={self.distance:.2f}, " \
-               f"velocity={self.velocity:.2f}, neo={self.neo!r})"
+        return _APPROACH_REPR % (self.time_str, self.distance, self.velocity, self.neo)
 
     def formatted_to_csv(self):
-        """Return the object formatted for csv files."""
-        return {'datetime_utc': self.time_str,
-                'distance_au': self.distance,
-                'velocity_km_s': self.velocity,
-                'designation': self.neo.designation,
-                'name': self.neo.name, 'diameter_km': self.neo.diameter,
-                'potentially_hazardous': self.neo.hazardous}
+        """Return the object formatted as a csv row.
+
+        The values are in the order of the `write_to_csv` header: datetime_utc,
+        distance_au, velocity_km_s, designation, name, diameter_km,
+        potentially_hazardous.
+        """
+        return (self.time_str, self.distance, self.velocity,
+                self.neo.designation, self.neo.name, self.neo.diameter,
+                self.neo.hazardous)
 
     def formatted_to_json(self):
         """Return the object formatted for json files."""
@@ -12,11 +12,14 @@ These tests should pass when Task 2 is complete.
 """
 import collections.abc
 import datetime
+import json
 import pathlib
 import math
+import sys
 import unittest
+import unittest.mock
 
-from extract import load_neos, load_approaches
+from extract import load_neos, load_approaches, _select_json_loads
 from models import NearEarthObject, CloseApproach
 
 
@@ -107,6 +110,17 @@ class TestLoadApproaches(unittest.TestCase):
         self.assertIsNotNone(approach)
         self.assertIsInstance(approach.time, datetime.datetime)
 
+    def test_approach_times_match_cd(self):
+        with open(TEST_CAD_FILE) as infile:
+            cad_info = json.load(infile)
+        cds = [row[cad_info['fields'].index('cd')] for row in cad_info['data']]
+        for approach, cd in zip(self.approaches, cds):
+            expected = datetime.datetime.strptime(cd, "%Y-%b-%d %H:%M")
+            self.assertEqual(approach.time, expected)
+            self.assertIs(approach.time, approach.time)
+            self.assertEqual(approach.time_str, expected.strftime("%Y-%m-%d %H:%M"))
+            self.assertIs(approach.time_str, approach.time_str)
+
     def test_approach_distance_is_float(self):
         approach = self.get_first_approach_or_none()
         self.assertIsNotNone(approach)
@@ -118,5 +132,23 @@ class TestLoadApproaches(unittest.TestCase):
         self.assertIsInstance(approach.velocity, float)
 
 
+class TestLoadApproachesFallback(unittest.TestCase):
+    def test_stdlib_json_is_selected_without_optional_parsers(self):
+        with unittest.mock.patch.dict(sys.modules, {'orjson': None, 'ujson': None}):
+            self.assertIs(_select_json_loads(), json.loads)
+
+    @unittest.mock.patch('extract.json_loads', json.loads)
+    def test_stdlib_json_loads_the_same_approaches(self):
+        stdlib_approaches = load_approaches(TEST_CAD_FILE)
+        with unittest.mock.patch('extract.json_loads', _select_json_loads()):
+            default_approaches = load_approaches(TEST_CAD_FILE)
+
+        self.assertEqual(len(stdlib_approaches), len(default_approaches))
+        for stdlib, default in zip(stdlib_approaches, default_approaches):
+            self.assertEqual(stdlib._designation, default._designation)
+            self.assertEqual(stdlib.time, default.time)
+            self.assertEqual(stdlib.distance, default.distance)
+            self.assertEqual(stdlib.velocity, default.velocity)
+
 if __name__ == '__main__':
     unittest.main()
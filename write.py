@@ -30,10 +30,9 @@ def write_to_csv(results, filename):
     )
 
     with open(filename, 'w') as outfile:
-        neos_writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-        neos_writer.writeheader()
-        for elem in results:
-            neos_writer.writerow(elem.formatted_to_csv())
+        neos_writer = csv.writer(outfile)
+        neos_writer.writerow(fieldnames)
+        neos_writer.writerows(elem.formatted_to_csv() for elem in results)
 
 
 def write_to_json(results, filename):